@@ -0,0 +1,88 @@
+"""
+Response Cache Helpers
+
+Redis-backed cache for GET list responses.
+Each entry is a Redis hash holding the response body bytes, the time it was
+generated, the time it goes stale and a cache_fallback flag. Entries flagged for
+fallback are kept past their stale time so they can be served while MongoDB is
+unreachable; callers should only flag a bounded set of keys (e.g. unfiltered
+first pages), since every flagged entry is retained for FALLBACK_RETENTION.
+Caching is skipped when REDIS_URL is unset.
+"""
+
+import json
+import os
+import time
+from typing import Optional
+
+from dotenv import load_dotenv
+from redis import asyncio as aioredis
+
+# Load environment variables from .env file
+load_dotenv()
+
+# TTL policies in seconds
+SHORT_TTL = 10
+LONG_TTL = 30
+
+# How long stale entries are retained for fallback
+FALLBACK_RETENTION = 24 * 60 * 60
+
+_redis = None
+
+redis_url = os.getenv("REDIS_URL")
+
+if redis_url:
+    _redis = aioredis.from_url(redis_url)
+
+def cache_key(namespace: str, params: dict) -> str:
+    """Build a cache key from the endpoint namespace and its query parameters"""
+    return f"cache:{namespace}:{json.dumps(params, sort_keys=True, default=str)}"
+
+async def get_cached(key: str, allow_stale: bool = False) -> Optional[bytes]:
+    """Return the cached body if present and not yet stale
+
+    With allow_stale, an expired entry is returned as long as it was stored
+    with cache_fallback enabled.
+    """
+    if _redis is None:
+        return None
+    try:
+        entry = await _redis.hgetall(key)
+    except Exception:
+        return None
+    if not entry:
+        return None
+    if float(entry[b"stale_at"]) < time.time():
+        if not (allow_stale and entry.get(b"cache_fallback") == b"1"):
+            return None
+    return entry[b"body"]
+
+async def set_cached(key: str, body: bytes, ttl: int, cache_fallback: bool = False):
+    """Store a response body with generated/stale timestamps"""
+    if _redis is None:
+        return
+    now = time.time()
+    try:
+        async with _redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={
+                "body": body,
+                "generated_at": now,
+                "stale_at": now + ttl,
+                "cache_fallback": int(cache_fallback),
+            })
+            pipe.expire(key, FALLBACK_RETENTION if cache_fallback else ttl)
+            await pipe.execute()
+    except Exception:
+        pass
+
+async def clear_namespace(namespace: str):
+    """Drop every cached entry for an endpoint namespace"""
+    if _redis is None:
+        return
+    try:
+        keys = [k async for k in _redis.scan_iter(match=f"cache:{namespace}:*")]
+        if keys:
+            await _redis.delete(*keys)
+    except Exception:
+        pass
@@ -5,16 +5,21 @@ MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
 """
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError, PyMongoError
 from datetime import datetime, timezone
+import logging
 import os
 from dotenv import load_dotenv
-from typing import Union
-from pydantic import BaseModel
+from typing import List, Union
+from pydantic import AnyUrl, BaseModel
+from pydantic_core import Url
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 _client = None
 db = None
 
@@ -22,34 +27,107 @@ database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
 if database_url and database_name:
-    _client = MongoClient(database_url)
+    # Fail fast when Mongo is unreachable so list endpoints can fall back to
+    # stale cache instead of waiting out the driver's 30s default
+    _client = AsyncIOMotorClient(
+        database_url,
+        serverSelectionTimeoutMS=int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 2000)),
+    )
     db = _client[database_name]
 
 # Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
-    """Insert a single document with timestamp"""
-    if db is None:
-        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+def _bson_ready(value):
+    """Convert Url values, which BSON cannot encode, to str"""
+    if isinstance(value, (AnyUrl, Url)):
+        return str(value)
+    if isinstance(value, list):
+        return [_bson_ready(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _bson_ready(v) for k, v in value.items()}
+    return value
 
-    # Convert Pydantic model to dict if needed
+def _prepare_document(data: Union[BaseModel, dict]) -> dict:
+    """Convert to a plain dict and stamp created/updated times"""
+    # Convert Pydantic model to dict if needed; the model is already
+    # validated, so dump to Python objects (keeping datetimes native) and
+    # only turn Url values into strings
     if isinstance(data, BaseModel):
-        data_dict = data.model_dump()
+        data_dict = _bson_ready(data.model_dump(mode="python", exclude_none=True))
     else:
         data_dict = data.copy()
 
     data_dict['created_at'] = datetime.now(timezone.utc)
     data_dict['updated_at'] = datetime.now(timezone.utc)
+    return data_dict
+
+async def create_document(collection_name: str, data: Union[BaseModel, dict]):
+    """Insert a single document with timestamp"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    doc = _prepare_document(data)
+    await db[collection_name].insert_one(doc)
+    return str(doc["_id"])
+
+async def create_documents(collection_name: str, items: List[Union[BaseModel, dict]]) -> int:
+    """Insert many documents with timestamps in a single round-trip
 
-    result = db[collection_name].insert_one(data_dict)
-    return str(result.inserted_id)
+    Returns the number inserted; per-document write errors are logged
+    rather than raised, so the rest of the batch still counts.
+    """
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    # Unordered so one bad document does not abort the rest of the batch
+    try:
+        result = await db[collection_name].insert_many([_prepare_document(d) for d in items], ordered=False)
+    except BulkWriteError as e:
+        logger.warning("Partial insert into %s: %s", collection_name, e.details.get("writeErrors"))
+        return e.details["nInserted"]
+    return len(result.inserted_ids)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
-    """Get documents from collection"""
+async def get_documents(
+    collection_name: str,
+    filter_dict: dict = None,
+    limit: int = None,
+    projection: dict = None,
+    skip: int = 0,
+    sort: list = None,
+):
+    """Get documents from collection, optionally projected, sorted and paged
+
+    Documents are returned with a string "id" in place of the ObjectId "_id",
+    converted by MongoDB in the aggregation pipeline.
+    """
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
-    
-    cursor = db[collection_name].find(filter_dict or {})
+
+    pipeline = [{"$match": filter_dict or {}}]
+    if sort:
+        pipeline.append({"$sort": dict(sort)})
+    if skip:
+        pipeline.append({"$skip": skip})
     if limit:
-        cursor = cursor.limit(limit)
-    
-    return list(cursor)
+        pipeline.append({"$limit": limit})
+    if projection:
+        pipeline.append({"$project": projection})
+    pipeline.append({"$addFields": {"id": {"$toString": "$_id"}}})
+    pipeline.append({"$project": {"_id": 0}})
+
+    return await db[collection_name].aggregate(pipeline).to_list(length=None)
+
+async def ensure_indexes():
+    """Create indexes backing the list endpoint filters
+
+    Failures are logged rather than raised so an unreachable database
+    does not stop the app from starting.
+    """
+    if db is None:
+        return
+
+    try:
+        await db.product.create_index([("category", 1), ("room_type", 1), ("in_stock", 1)])
+        await db.blogpost.create_index([("published", 1), ("keywords", 1)])
+        await db.testimonial.create_index([("rating", 1)])
+    except PyMongoError as e:
+        logger.warning("Could not create indexes: %s", e)
@@ -1,13 +1,25 @@
+import asyncio
+import logging
 import os
-from typing import List, Optional
-from fastapi import FastAPI, Query, HTTPException
+from typing import Optional
+import httpx
+import orjson
+from fastapi import FastAPI, Query, HTTPException, Response, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+import pydantic
+import pydantic_core
+from pymongo.errors import PyMongoError
 
-from database import create_document, get_documents, db
+from database import create_document, get_documents, ensure_indexes, db
+from cache import SHORT_TTL, LONG_TTL, cache_key, get_cached, set_cached
 from schemas import Product, Project, Testimonial, Lead, BlogPost
+from seed_data import seed_demo_content
 
-app = FastAPI(title="Interior Design Studio API")
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="Interior Design Studio API", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -17,17 +29,98 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# List responses repeat the same JSON keys per document and compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+async def _stop_task(task: Optional[asyncio.Task]):
+    """Cancel a background task and wait for it, logging any failure it hit"""
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    except Exception:
+        logger.exception("Background task failed")
+
+@app.on_event("startup")
+async def log_versions():
+    # Confirms the compiled Rust validator is in use without exposing it on /test
+    logger.info("pydantic %s (core %s)", pydantic.VERSION, pydantic_core.__version__)
+
+@app.on_event("startup")
+async def create_indexes():
+    # Run in the background so a slow or unreachable Mongo does not delay boot
+    app.state.index_task = asyncio.create_task(ensure_indexes()) if db is not None else None
+
+@app.on_event("shutdown")
+async def stop_index_creation():
+    await _stop_task(app.state.index_task)
+
+@app.on_event("startup")
+async def create_http_client():
+    # Shared keep-alive pool so HubSpot calls skip the TCP/TLS handshake
+    app.state.http = httpx.AsyncClient(
+        base_url="https://api.hubapi.com",
+        timeout=5,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await app.state.http.aclose()
+
+# Seconds between database health probes backing /test
+DB_PROBE_INTERVAL = 30
+
+async def _probe_database():
+    """List collections once and store the result on app.state"""
+    if db is None:
+        return
+    # Build the result first so /test keeps the previous values while waiting
+    ok, error, collections = False, None, []
+    try:
+        collections = (await db.list_collection_names())[:10]
+        ok = True
+    except Exception as e:
+        error = str(e)[:50]
+    app.state.db_ok = ok
+    app.state.db_error = error
+    app.state.collections = collections
+
+async def _refresh_database_probe():
+    while True:
+        await _probe_database()
+        await asyncio.sleep(DB_PROBE_INTERVAL)
+
+@app.on_event("startup")
+async def start_database_probe():
+    # The first probe runs in the task so an unreachable Mongo does not delay boot
+    app.state.db_probe_task = asyncio.create_task(_refresh_database_probe()) if db is not None else None
+
+@app.on_event("shutdown")
+async def stop_database_probe():
+    await _stop_task(app.state.db_probe_task)
+
+# Constant payloads, encoded once at import
+_ROOT_BYTES = orjson.dumps({"message": "Interior Design Studio Backend running"})
+_HELLO_BYTES = orjson.dumps({"message": "Hello from the backend API!"})
+
 @app.get("/")
-def read_root():
-    return {"message": "Interior Design Studio Backend running"}
+async def read_root():
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 @app.get("/api/hello")
-def hello():
-    return {"message": "Hello from the backend API!"}
+async def hello():
+    return Response(content=_HELLO_BYTES, media_type="application/json")
 
 @app.get("/test")
-def test_database():
-    """Test endpoint to check if database is available and accessible"""
+async def test_database():
+    """Test endpoint to check if database is available and accessible
+
+    Reports the result of the last background probe rather than querying Mongo.
+    """
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -37,123 +130,203 @@ def test_database():
         "collections": []
     }
 
-    try:
-        if db is not None:
-            response["database"] = "✅ Available"
-            response["database_url"] = "✅ Configured"
-            response["database_name"] = db.name if hasattr(db, 'name') else "✅ Connected"
-            response["connection_status"] = "Connected"
-            try:
-                collections = db.list_collection_names()
-                response["collections"] = collections[:10]
-                response["database"] = "✅ Connected & Working"
-            except Exception as e:
-                response["database"] = f"⚠️  Connected but Error: {str(e)[:50]}"
+    if db is not None:
+        response["database_name"] = db.name if hasattr(db, 'name') else "✅ Connected"
+        response["connection_status"] = "Connected"
+        if getattr(app.state, "db_ok", False):
+            response["collections"] = app.state.collections
+            response["database"] = "✅ Connected & Working"
+        elif getattr(app.state, "db_error", None):
+            response["database"] = f"⚠️  Connected but Error: {app.state.db_error}"
         else:
-            response["database"] = "⚠️  Available but not initialized"
-    except Exception as e:
-        response["database"] = f"❌ Error: {str(e)[:50]}"
+            response["database"] = "✅ Available"
+    else:
+        response["database"] = "⚠️  Available but not initialized"
 
     response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
     response["database_name"] = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
 
     return response
 
-# Helper to transform Mongo documents
-class DocumentOut(BaseModel):
-    id: str
-    data: dict
+# Filter keys per list endpoint, in handler argument order
+PRODUCT_FILTER_KEYS = ("category", "room_type", "in_stock")
+PROJECT_FILTER_KEYS = ("style", "room")
+BLOGPOST_FILTER_KEYS = ("published", "keywords")
+
+# Fields returned by default for list cards
+PRODUCT_CARD_FIELDS = {"title": 1, "price": 1, "category": 1, "room_type": 1, "image_url": 1, "in_stock": 1}
+PROJECT_CARD_FIELDS = {"title": 1, "style": 1, "room": 1, "budget_range": 1, "duration_weeks": 1, "after_image_url": 1}
+TESTIMONIAL_CARD_FIELDS = {"client_name": 1, "project_type": 1, "rating": 1, "quote": 1, "photo_url": 1}
+BLOGPOST_CARD_FIELDS = {"title": 1, "slug": 1, "excerpt": 1, "cover_image_url": 1, "keywords": 1, "published": 1}
+
+# Fields a client may request via ?fields=, per list endpoint
+_STORED_FIELDS = frozenset({"id", "created_at", "updated_at"})
+PRODUCT_FIELDS = _STORED_FIELDS | Product.model_fields.keys()
+PROJECT_FIELDS = _STORED_FIELDS | Project.model_fields.keys()
+TESTIMONIAL_FIELDS = _STORED_FIELDS | Testimonial.model_fields.keys()
+BLOGPOST_FIELDS = _STORED_FIELDS | BlogPost.model_fields.keys()
+
+FIELDS_QUERY = Query(None, description="Comma-separated fields to return, or 'all' for full documents")
+PAGE_QUERY = Query(1, ge=1)
+PAGE_SIZE_QUERY = Query(20, ge=1, le=100)
+
+# Newest first; _id embeds the insertion time
+LIST_SORT = [("_id", -1)]
+
+# Seconds a list query may take before the stale-cache fallback kicks in
+DB_QUERY_TIMEOUT = float(os.getenv("DB_QUERY_TIMEOUT", 3))
+
+def _filt(keys: tuple, values: tuple) -> dict:
+    """Build a Mongo filter from parallel key/value tuples, dropping None and empty values"""
+    # Empty query values such as ?category= were ignored before; keep it that way
+    return {k: v for k, v in zip(keys, values) if v not in (None, "")}
 
 
-def _serialize_docs(docs: List[dict]) -> List[dict]:
-    serialized = []
-    for d in docs:
-        d = dict(d)
-        if "_id" in d:
-            d["id"] = str(d.pop("_id"))
-        serialized.append(d)
-    return serialized
+def _projection(fields: Optional[str], default: dict, allowed: frozenset) -> Optional[dict]:
+    """Map the ?fields= query param to a Mongo projection
+
+    Unknown field names are rejected with a 422.
+    """
+    if fields is None:
+        return default
+    if fields == "all":
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    if not requested:
+        return default
+    unknown = requested - allowed
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    # id is derived from _id, which every projection keeps
+    return {f: 1 for f in requested - {"id"}} or {"_id": 1}
+
+
+async def _cached_list(
+    collection: str,
+    filt: dict,
+    ttl: int,
+    projection: Optional[dict] = None,
+    page: int = 1,
+    page_size: int = 20,
+    cache_fallback: bool = False,
+) -> Response:
+    """Serve a list endpoint from Redis, querying Mongo on a miss
+
+    If Mongo is unreachable or slower than DB_QUERY_TIMEOUT, fall back to a
+    stale cached body before failing.
+    Only first pages whose caller passes cache_fallback (no free-form filters
+    or fields) are retained for fallback, which keeps that key set bounded.
+    """
+    key = cache_key(collection, {"filter": filt, "projection": projection, "page": page, "page_size": page_size})
+    body = await get_cached(key)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT"})
+    try:
+        docs = await asyncio.wait_for(
+            get_documents(
+                collection,
+                filt,
+                limit=page_size,
+                projection=projection,
+                skip=(page - 1) * page_size,
+                sort=LIST_SORT,
+            ),
+            timeout=DB_QUERY_TIMEOUT,
+        )
+    except (PyMongoError, asyncio.TimeoutError) as e:
+        body = await get_cached(key, allow_stale=True)
+        if body is not None:
+            return Response(content=body, media_type="application/json", headers={"X-Cache": "STALE"})
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    body = orjson.dumps(docs)
+    await set_cached(key, body, ttl, cache_fallback=cache_fallback and page == 1)
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
 
 # PRODUCTS
 @app.get("/api/products")
 async def list_products(
     category: Optional[str] = Query(None),
     room_type: Optional[str] = Query(None),
-    in_stock: Optional[bool] = Query(None)
+    in_stock: Optional[bool] = Query(None),
+    fields: Optional[str] = FIELDS_QUERY,
+    page: int = PAGE_QUERY,
+    page_size: int = PAGE_SIZE_QUERY
 ):
-    filt = {}
-    if category:
-        filt["category"] = category
-    if room_type:
-        filt["room_type"] = room_type
-    if in_stock is not None:
-        filt["in_stock"] = in_stock
-    try:
-        docs = get_documents("product", filt)
-        return _serialize_docs(docs)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    filt = _filt(PRODUCT_FILTER_KEYS, (category, room_type, in_stock))
+    return await _cached_list("product", filt, LONG_TTL, _projection(fields, PRODUCT_CARD_FIELDS, PRODUCT_FIELDS), page, page_size,
+                              cache_fallback=fields is None and not (category or room_type))
 
 # PROJECTS / PORTFOLIO
 @app.get("/api/projects")
-async def list_projects(style: Optional[str] = Query(None), room: Optional[str] = Query(None)):
-    filt = {}
-    if style:
-        filt["style"] = style
-    if room:
-        filt["room"] = room
-    try:
-        docs = get_documents("project", filt)
-        return _serialize_docs(docs)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def list_projects(
+    style: Optional[str] = Query(None),
+    room: Optional[str] = Query(None),
+    fields: Optional[str] = FIELDS_QUERY,
+    page: int = PAGE_QUERY,
+    page_size: int = PAGE_SIZE_QUERY
+):
+    filt = _filt(PROJECT_FILTER_KEYS, (style, room))
+    return await _cached_list("project", filt, LONG_TTL, _projection(fields, PROJECT_CARD_FIELDS, PROJECT_FIELDS), page, page_size,
+                              cache_fallback=fields is None and not (style or room))
 
 # TESTIMONIALS
 @app.get("/api/testimonials")
-async def list_testimonials(min_rating: int = Query(1, ge=1, le=5)):
+async def list_testimonials(
+    min_rating: int = Query(1, ge=1, le=5),
+    fields: Optional[str] = FIELDS_QUERY,
+    page: int = PAGE_QUERY,
+    page_size: int = PAGE_SIZE_QUERY
+):
     filt = {"rating": {"$gte": min_rating}}
-    try:
-        docs = get_documents("testimonial", filt)
-        return _serialize_docs(docs)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _cached_list("testimonial", filt, LONG_TTL, _projection(fields, TESTIMONIAL_CARD_FIELDS, TESTIMONIAL_FIELDS), page, page_size,
+                              cache_fallback=fields is None)
 
 # BLOG POSTS
 @app.get("/api/blogposts")
-async def list_blogposts(published: bool = True, keyword: Optional[str] = Query(None)):
-    filt = {"published": published}
-    if keyword:
-        filt["keywords"] = {"$in": [keyword]}
-    try:
-        docs = get_documents("blogpost", filt)
-        return _serialize_docs(docs)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def list_blogposts(
+    published: bool = True,
+    keyword: Optional[str] = Query(None),
+    fields: Optional[str] = FIELDS_QUERY,
+    page: int = PAGE_QUERY,
+    page_size: int = PAGE_SIZE_QUERY
+):
+    filt = _filt(BLOGPOST_FILTER_KEYS, (published, {"$in": [keyword]} if keyword else None))
+    return await _cached_list("blogpost", filt, SHORT_TTL, _projection(fields, BLOGPOST_CARD_FIELDS, BLOGPOST_FIELDS), page, page_size,
+                              cache_fallback=fields is None and not keyword)
 
 # LEADS
+# HubSpot request headers, or None when the integration is disabled
+_HUBSPOT_HEADERS = (
+    {"Authorization": f"Bearer {_hubspot_key}", "Content-Type": "application/json"}
+    if (_hubspot_key := os.getenv("HUBSPOT_API_KEY"))
+    else None
+)
+
+async def _send_to_hubspot(lead: Lead):
+    """Create a contact in HubSpot (v3); failures are ignored"""
+    payload = {
+        "properties": {
+            "email": lead.email,
+            "firstname": lead.name,
+            "phone": lead.phone or "",
+            "lifecyclestage": "lead",
+            "notes": lead.project_details or ""
+        }
+    }
+    try:
+        await app.state.http.post("/crm/v3/objects/contacts", json=payload, headers=_HUBSPOT_HEADERS)
+    except Exception:
+        pass
+
 @app.post("/api/leads")
-async def create_lead(lead: Lead):
+async def create_lead(lead: Lead, background_tasks: BackgroundTasks):
     try:
-        lead_id = create_document("lead", lead)
+        lead_id = await create_document("lead", lead)
         # Optional: HubSpot integration if API key present
-        hubspot_key = os.getenv("HUBSPOT_API_KEY")
-        if hubspot_key:
-            try:
-                import requests
-                # Simple example to create a contact in HubSpot (v3)
-                headers = {"Authorization": f"Bearer {hubspot_key}", "Content-Type": "application/json"}
-                payload = {
-                    "properties": {
-                        "email": lead.email,
-                        "firstname": lead.name,
-                        "phone": lead.phone or "",
-                        "lifecyclestage": "lead",
-                        "notes": lead.project_details or ""
-                    }
-                }
-                requests.post("https://api.hubapi.com/crm/v3/objects/contacts", json=payload, headers=headers, timeout=5)
-            except Exception:
-                pass
+        if _HUBSPOT_HEADERS is not None:
+            background_tasks.add_task(_send_to_hubspot, lead)
         return {"id": lead_id, "status": "received"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -164,35 +337,8 @@ async def seed_demo(token: Optional[str] = Query(None)):
     if token != os.getenv("SEED_TOKEN", "dev"):
         raise HTTPException(status_code=403, detail="Forbidden")
     try:
-        # Add a few demo products
-        demo_products = [
-            Product(title="Modern Lounge Chair", description="Ergonomic lounge chair in walnut finish.", price=799.0, category="furniture", room_type="living room", in_stock=True, tags=["modern", "wood"]),
-            Product(title="Marble Pendant Light", description="Minimal pendant for kitchen islands.", price=199.0, category="lighting", room_type="kitchen", in_stock=True, tags=["minimal", "lighting"]),
-        ]
-        for p in demo_products:
-            create_document("product", p)
-
-        demo_testimonials = [
-            Testimonial(client_name="Ava Patel", project_type="Full Home", rating=5, quote="They transformed our space beyond expectations!"),
-            Testimonial(client_name="Liam Chen", project_type="Kitchen Remodel", rating=5, quote="Professional, timely, and stunning results."),
-        ]
-        for t in demo_testimonials:
-            create_document("testimonial", t)
-
-        demo_projects = [
-            Project(title="Skyline Penthouse", style="Modern", room="Living Room", budget_range="$$$", duration_weeks=12, description="A sleek urban living space with panoramic views."),
-            Project(title="Cozy Minimal Bedroom", style="Minimalist", room="Bedroom", budget_range="$$", duration_weeks=6, description="Calming tones with functional storage solutions."),
-        ]
-        for pr in demo_projects:
-            create_document("project", pr)
-
-        demo_posts = [
-            BlogPost(title="Top 7 Custom Home Interiors Trends", slug="custom-home-interiors-trends", excerpt="Explore the latest in custom home interiors.", content="Long-form content about custom home interiors...", keywords=["custom home interiors", "interior design"], published=True),
-        ]
-        for b in demo_posts:
-            create_document("blogpost", b)
-
-        return {"status": "seeded"}
+        inserted = await seed_demo_content()
+        return {"status": "seeded", "inserted": inserted}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -200,4 +346,7 @@ async def seed_demo(token: Optional[str] = Query(None)):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Workers need an import string; in-process state is per worker, shared cache lives in Redis
+    workers = int(os.getenv("WEB_WORKERS", os.cpu_count() or 2))
+    # loop="auto" picks uvloop when installed (not on Windows) and asyncio otherwise
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=workers, loop="auto", http="httptools")
@@ -0,0 +1,56 @@
+"""
+Demo Seed Data
+
+Demo content for the seed endpoint, validated once at import.
+Run `python seed_data.py` to seed the configured database without the API.
+"""
+
+import asyncio
+
+from database import create_documents
+from cache import clear_namespace
+from schemas import Product, Project, Testimonial, BlogPost
+
+DEMO_PRODUCTS = [
+    Product(title="Modern Lounge Chair", description="Ergonomic lounge chair in walnut finish.", price=799.0, category="furniture", room_type="living room", in_stock=True, tags=["modern", "wood"]),
+    Product(title="Marble Pendant Light", description="Minimal pendant for kitchen islands.", price=199.0, category="lighting", room_type="kitchen", in_stock=True, tags=["minimal", "lighting"]),
+]
+
+DEMO_TESTIMONIALS = [
+    Testimonial(client_name="Ava Patel", project_type="Full Home", rating=5, quote="They transformed our space beyond expectations!"),
+    Testimonial(client_name="Liam Chen", project_type="Kitchen Remodel", rating=5, quote="Professional, timely, and stunning results."),
+]
+
+DEMO_PROJECTS = [
+    Project(title="Skyline Penthouse", style="Modern", room="Living Room", budget_range="$$$", duration_weeks=12, description="A sleek urban living space with panoramic views."),
+    Project(title="Cozy Minimal Bedroom", style="Minimalist", room="Bedroom", budget_range="$$", duration_weeks=6, description="Calming tones with functional storage solutions."),
+]
+
+DEMO_POSTS = [
+    BlogPost(title="Top 7 Custom Home Interiors Trends", slug="custom-home-interiors-trends", excerpt="Explore the latest in custom home interiors.", content="Long-form content about custom home interiors...", keywords=["custom home interiors", "interior design"], published=True),
+]
+
+DEMO_CONTENT = {
+    "product": DEMO_PRODUCTS,
+    "testimonial": DEMO_TESTIMONIALS,
+    "project": DEMO_PROJECTS,
+    "blogpost": DEMO_POSTS,
+}
+
+async def seed_demo_content() -> dict:
+    """Insert all demo content, one batch per collection, and drop stale cache entries
+
+    Returns the number of documents inserted per collection.
+    """
+    inserted = {}
+    for collection, items in DEMO_CONTENT.items():
+        try:
+            inserted[collection] = await create_documents(collection, items)
+        finally:
+            # Some documents may have landed even if the insert failed
+            await clear_namespace(collection)
+    return inserted
+
+
+if __name__ == "__main__":
+    print("seeded", asyncio.run(seed_demo_content()))
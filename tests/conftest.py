@@ -0,0 +1,95 @@
+import asyncio
+import fnmatch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import cache
+import main
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hset(self, key, mapping):
+        self.ops.append(("hset", key, mapping))
+
+    def expire(self, key, seconds):
+        self.ops.append(("expire", key, seconds))
+
+    async def execute(self):
+        for op, key, arg in self.ops:
+            if op == "hset":
+                self.redis.store[key] = {
+                    k.encode(): v if isinstance(v, bytes) else str(v).encode() for k, v in arg.items()
+                }
+            else:
+                self.redis.expiry[key] = arg
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio calls cache.py makes"""
+
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+
+    async def hgetall(self, key):
+        return dict(self.store.get(key, {}))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def scan_iter(self, match):
+        for key in list(self.store):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def make_stale(self, key):
+        """Move a cached entry's stale time into the past"""
+        self.store[key][b"stale_at"] = b"0"
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_redis", fake)
+    return fake
+
+
+@pytest.fixture
+def docs(monkeypatch):
+    """Stub get_documents and record the arguments of each call"""
+    calls = []
+    result = {"docs": [{"id": "abc", "title": "Chair"}], "error": None, "delay": 0}
+
+    async def fake_get_documents(collection, filter_dict=None, **kwargs):
+        calls.append({"collection": collection, "filter": filter_dict, **kwargs})
+        if result["delay"]:
+            await asyncio.sleep(result["delay"])
+        if result["error"] is not None:
+            raise result["error"]
+        return result["docs"]
+
+    monkeypatch.setattr(main, "get_documents", fake_get_documents)
+    result["calls"] = calls
+    return result
+
+
+@pytest.fixture
+def client():
+    # No context manager: skip startup hooks, which need Mongo and httpx
+    return TestClient(main.app)
+
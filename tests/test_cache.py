@@ -0,0 +1,30 @@
+import asyncio
+
+import cache
+
+
+def test_get_cached_returns_fresh_entry(redis):
+    asyncio.run(cache.set_cached("cache:product:k", b"[]", 30))
+    assert asyncio.run(cache.get_cached("cache:product:k")) == b"[]"
+    assert redis.expiry["cache:product:k"] == 30
+
+
+def test_get_cached_skips_stale_entry(redis):
+    asyncio.run(cache.set_cached("cache:product:k", b"[]", 30, cache_fallback=True))
+    redis.make_stale("cache:product:k")
+    assert asyncio.run(cache.get_cached("cache:product:k")) is None
+    assert asyncio.run(cache.get_cached("cache:product:k", allow_stale=True)) == b"[]"
+    assert redis.expiry["cache:product:k"] == cache.FALLBACK_RETENTION
+
+
+def test_stale_entry_without_fallback_flag_is_not_served(redis):
+    asyncio.run(cache.set_cached("cache:product:k", b"[]", 30))
+    redis.make_stale("cache:product:k")
+    assert asyncio.run(cache.get_cached("cache:product:k", allow_stale=True)) is None
+
+
+def test_clear_namespace_only_drops_that_namespace(redis):
+    asyncio.run(cache.set_cached("cache:product:a", b"1", 30))
+    asyncio.run(cache.set_cached("cache:blogpost:a", b"2", 30))
+    asyncio.run(cache.clear_namespace("product"))
+    assert list(redis.store) == ["cache:blogpost:a"]
@@ -0,0 +1,40 @@
+import asyncio
+from datetime import datetime
+
+import bson
+from pymongo.errors import BulkWriteError
+
+import database
+from database import _prepare_document
+from schemas import Lead, Project
+
+
+def test_prepared_model_is_bson_encodable():
+    project = Project(
+        title="Loft",
+        after_image_url="https://example.com/after.webp",
+        gallery=["https://example.com/1.webp", "https://example.com/2.webp"],
+    )
+    doc = _prepare_document(project)
+    assert doc["after_image_url"] == "https://example.com/after.webp"
+    assert doc["gallery"] == ["https://example.com/1.webp", "https://example.com/2.webp"]
+    assert "before_image_url" not in doc
+    bson.encode(doc)
+
+
+def test_prepared_model_keeps_datetimes_native():
+    lead = Lead(name="Ava", email="ava@example.com", preferred_date="2026-01-02T10:00:00")
+    doc = _prepare_document(lead)
+    assert isinstance(doc["preferred_date"], datetime)
+    assert isinstance(doc["created_at"], datetime)
+
+
+def test_create_documents_reports_partial_insert(monkeypatch):
+    class FailingCollection:
+        async def insert_many(self, docs, ordered):
+            assert ordered is False
+            raise BulkWriteError({"nInserted": len(docs) - 1, "writeErrors": [{"index": 0}]})
+
+    monkeypatch.setattr(database, "db", {"lead": FailingCollection()})
+    leads = [Lead(name="Ava", email="ava@example.com"), Lead(name="Liam", email="liam@example.com")]
+    assert asyncio.run(database.create_documents("lead", leads)) == 1
@@ -0,0 +1,61 @@
+from pymongo.errors import PyMongoError
+
+import main
+
+
+def test_cache_miss_then_hit(redis, docs, client):
+    first = client.get("/api/products")
+    second = client.get("/api/products")
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == [{"id": "abc", "title": "Chair"}]
+    assert len(docs["calls"]) == 1
+
+
+def test_page_maps_to_skip_and_limit(redis, docs, client):
+    client.get("/api/products", params={"page": 3, "page_size": 25})
+    call = docs["calls"][0]
+    assert call["skip"] == 50
+    assert call["limit"] == 25
+
+
+def test_stale_fallback_when_mongo_fails(redis, docs, client):
+    client.get("/api/products")
+    (key,) = redis.store
+    redis.make_stale(key)
+    docs["error"] = PyMongoError("down")
+    response = client.get("/api/products")
+    assert response.status_code == 200
+    assert response.headers["X-Cache"] == "STALE"
+
+
+def test_stale_fallback_when_mongo_times_out(redis, docs, client, monkeypatch):
+    client.get("/api/products")
+    (key,) = redis.store
+    redis.make_stale(key)
+    monkeypatch.setattr(main, "DB_QUERY_TIMEOUT", 0.05)
+    docs["delay"] = 1
+    response = client.get("/api/products")
+    assert response.status_code == 200
+    assert response.headers["X-Cache"] == "STALE"
+
+
+def test_mongo_failure_without_cache_is_500(redis, docs, client):
+    docs["error"] = PyMongoError("down")
+    assert client.get("/api/products").status_code == 500
+
+
+def test_only_unfiltered_first_pages_kept_for_fallback(redis, docs, client):
+    client.get("/api/products", params={"page": 2})
+    client.get("/api/products", params={"category": "lighting"})
+    assert all(entry[b"cache_fallback"] == b"0" for entry in redis.store.values())
+
+
+def test_unknown_fields_rejected(redis, docs, client):
+    assert client.get("/api/products", params={"fields": "$foo"}).status_code == 422
+    assert docs["calls"] == []
+
+
+def test_empty_filter_values_ignored(redis, docs, client):
+    client.get("/api/products", params={"category": "", "room_type": ""})
+    assert docs["calls"][0]["filter"] == {}
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+import seed_data
+
+
+def test_seed_clears_cache_even_when_insert_fails(monkeypatch):
+    cleared = []
+
+    async def failing_create_documents(collection, items):
+        raise RuntimeError("down")
+
+    async def record_clear(namespace):
+        cleared.append(namespace)
+
+    monkeypatch.setattr(seed_data, "create_documents", failing_create_documents)
+    monkeypatch.setattr(seed_data, "clear_namespace", record_clear)
+    with pytest.raises(RuntimeError):
+        asyncio.run(seed_data.seed_demo_content())
+    assert cleared == ["product"]
+
+
+def test_seed_reports_inserted_counts(monkeypatch):
+    async def create_documents(collection, items):
+        return len(items)
+
+    async def clear_namespace(namespace):
+        pass
+
+    monkeypatch.setattr(seed_data, "create_documents", create_documents)
+    monkeypatch.setattr(seed_data, "clear_namespace", clear_namespace)
+    inserted = asyncio.run(seed_data.seed_demo_content())
+    assert inserted == {name: len(items) for name, items in seed_data.DEMO_CONTENT.items()}